@@ -12,12 +12,13 @@ import json
 import logging
 import os
 import subprocess
+import time
 from typing import TYPE_CHECKING
 
 from sendspin_bridge.bluetooth.dbus import _dbus_get_media_transport_state, _dbus_has_media_endpoint
-from sendspin_bridge.config import CONFIG_FILE, save_device_sink
-from sendspin_bridge.config import config_lock as config_lock
+from sendspin_bridge.config import load_config, save_device_sink
 from sendspin_bridge.services.audio.pulse import (
+    _PACTL,
     cycle_card_profile,
     get_sink_volume,
     list_cards,
@@ -25,6 +26,7 @@ from sendspin_bridge.services.audio.pulse import (
     set_card_profile,
     set_sink_mute,
     set_sink_volume,
+    wait_for_sink,
 )
 
 if TYPE_CHECKING:
@@ -148,13 +150,13 @@ def _force_sbc_codec(pa_mac: str) -> None:
     """
     card_prefix = f"bluez_card.{pa_mac}"
     try:
-        cards = subprocess.check_output(["pactl", "list", "short", "cards"], text=True, timeout=5)
+        cards = subprocess.check_output([_PACTL, "list", "short", "cards"], text=True, timeout=5)
         for line in cards.splitlines():
             if card_prefix in line:
                 card_name = line.split()[1]
                 result = subprocess.run(
                     [
-                        "pactl",
+                        _PACTL,
                         "send-message",
                         f"/card/{card_name}/bluez5/set_codec",
                         "a2dp_sink",
@@ -197,15 +199,11 @@ def configure_bluetooth_audio(
     try:
         pa_mac = mac_address.replace(":", "_")
 
-        # Try cached sink name first — avoids 3s A2DP delay on service restart
-        cached_sink = None
-        try:
-            if CONFIG_FILE.exists():
-                with config_lock, open(CONFIG_FILE) as f:
-                    cfg = json.load(f)
-                cached_sink = cfg.get("LAST_SINKS", {}).get(mac_address)
-        except (OSError, json.JSONDecodeError, ValueError):
-            pass
+        # Try cached sink name first — avoids 3s A2DP delay on service restart.
+        # load_config() is stat-cached, so the reconnect path doesn't re-parse
+        # config.json; it also runs the MAC-key normalisation the raw read
+        # here used to bypass.
+        cached_sink = load_config().get("LAST_SINKS", {}).get(mac_address)
 
         fast_path_taken = False
         configured_sink: str | None = None
@@ -238,17 +236,10 @@ def configure_bluetooth_audio(
         if not fast_path_taken:
             if cached_sink:
                 logger.debug("Cached sink %s not available, falling back to discovery", cached_sink)
-            # Wait for PipeWire/PulseAudio to register the device.
-            if not wait_with_cancel(_A2DP_PROFILE_DELAY):
-                return False
-
-            # Log available sinks for diagnostics
-            sinks = list_sinks()
-            logger.info("Available audio sinks: %s", [s["name"] for s in sinks])
 
             # Find the Bluetooth sink
-            # CRITICAL: Audio routing — sink discovery with bounded retries (_SINK_RETRY_COUNT).
-            # If no sink found after retries, BT speaker will connect but play no audio.
+            # CRITICAL: Audio routing — if no sink appears within the budget,
+            # BT speaker will connect but play no audio.
             # Sink naming differs between PipeWire and PulseAudio — order matters.
             # The raw-colon `bluez_output.{mac_address}` variant is what
             # WirePlumber publishes on Ubuntu 26.04+; kept last so the
@@ -261,62 +252,64 @@ def configure_bluetooth_audio(
                 f"bluez_sink.{pa_mac}",
                 f"bluez_output.{mac_address}",  # PipeWire / WirePlumber (Ubuntu 26.04, raw MAC)
             ]
-            known_names = {s["name"] for s in sinks}
 
+            # Event-driven discovery: block on the PA 'sink' event stream via
+            # wait_for_sink and wake the moment a candidate is published,
+            # instead of the old fixed A2DP settle sleep plus 3 s polling
+            # rounds.  The wait runs in _SINK_RETRY_DELAY slices with a
+            # cancellation check between slices so release/stop still
+            # interrupts promptly; the total budget matches the old worst
+            # case (settle delay + _SINK_RETRY_COUNT retries).
             success = False
             configured_sink = None
-            for attempt in range(_SINK_RETRY_COUNT):
-                for sink_name in sink_names:
-                    if sink_name in known_names or get_sink_volume(sink_name) is not None:
-                        logger.info("✓ Found audio sink: %s", sink_name)
-                        configured_sink = sink_name
-                        success = True
-                        break
-                    else:
-                        logger.debug("Sink %s not found, trying next...", sink_name)
-                if success:
+            deadline = time.monotonic() + _A2DP_PROFILE_DELAY + _SINK_RETRY_COUNT * _SINK_RETRY_DELAY
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                found = wait_for_sink(sink_names, timeout=min(_SINK_RETRY_DELAY, remaining))
+                if found:
+                    logger.info("✓ Found audio sink: %s", found)
+                    configured_sink = found
+                    success = True
                     break
-                if attempt < _SINK_RETRY_COUNT - 1:
-                    logger.info(
-                        "Sink not yet available, retrying in 3s... (attempt %s/%s)",
-                        attempt + 1,
-                        _SINK_RETRY_COUNT,
-                    )
-                    if not wait_with_cancel(_SINK_RETRY_DELAY):
-                        return False
-                    sinks = list_sinks()
-                    known_names = {s["name"] for s in sinks}
+                if not wait_with_cancel(0):
+                    return False
+                logger.debug("Sink not yet available, waiting (%.0fs budget left)...", deadline - time.monotonic())
+
+            # Log available sinks for diagnostics before trying the profile fallbacks
+            sinks = list_sinks()
+            known_names = {s["name"] for s in sinks}
+            if not success:
+                logger.info("Available audio sinks: %s", [s["name"] for s in sinks])
 
             # AKG Y500 / BlueZ 5.82 regression: card connects in headset_head_unit
             # profile and no bluez_*sink is ever exposed. If a bluez_card for this
             # MAC exists with a non-a2dp active profile, switch it to a2dp_sink
             # and try one more sink discovery pass.
             if not success and _switch_card_profile_to_a2dp(pa_mac):
-                if not wait_with_cancel(_SINK_RETRY_DELAY):
+                found = wait_for_sink(sink_names, timeout=_SINK_RETRY_DELAY)
+                if not wait_with_cancel(0):
                     return False
-                sinks = list_sinks()
-                known_names = {s["name"] for s in sinks}
-                for sink_name in sink_names:
-                    if sink_name in known_names or get_sink_volume(sink_name) is not None:
-                        logger.info("✓ Found audio sink after profile switch: %s", sink_name)
-                        configured_sink = sink_name
-                        success = True
-                        break
+                if found:
+                    logger.info("✓ Found audio sink after profile switch: %s", found)
+                    configured_sink = found
+                    success = True
 
             # Fallback: direct set_card_profile sometimes leaves the card on
             # a2dp_sink but PA never re-publishes bluez_sink.*. A cycle
             # off → wait → a2dp_sink forces the republish in that scenario.
             if not success and _cycle_card_profile_for_mac(pa_mac):
-                if not wait_with_cancel(_SINK_RETRY_DELAY):
+                found = wait_for_sink(sink_names, timeout=_SINK_RETRY_DELAY)
+                if not wait_with_cancel(0):
                     return False
-                sinks = list_sinks()
-                known_names = {s["name"] for s in sinks}
-                for sink_name in sink_names:
-                    if sink_name in known_names or get_sink_volume(sink_name) is not None:
-                        logger.info("✓ Found audio sink after profile cycle: %s", sink_name)
-                        configured_sink = sink_name
-                        success = True
-                        break
+                if found:
+                    logger.info("✓ Found audio sink after profile cycle: %s", found)
+                    configured_sink = found
+                    success = True
+
+            if not success:
+                known_names = {s["name"] for s in list_sinks()}
 
         if success and configured_sink:
             if prefer_sbc:
@@ -325,20 +318,14 @@ def configure_bluetooth_audio(
             # Ensure sink is unmuted (PulseAudio may mute on BT reconnect)
             set_sink_mute(configured_sink, False)
 
-            # Resolve last saved volume for this device
+            # Resolve last saved volume for this device (stat-cached read —
+            # see the LAST_SINKS lookup above).
             restored_volume = None
-            try:
-                if CONFIG_FILE.exists():
-                    with config_lock, open(CONFIG_FILE) as f:
-                        cfg = json.load(f)
-                    volumes = cfg.get("LAST_VOLUMES", {})
-                    last_volume = volumes.get(mac_address)
-                    if last_volume is not None and isinstance(last_volume, int) and 0 <= last_volume <= 100:
-                        if set_sink_volume(configured_sink, last_volume):
-                            logger.info("✓ Restored volume to %s%% for %s", last_volume, mac_address)
-                            restored_volume = last_volume
-            except (OSError, json.JSONDecodeError, ValueError) as e:
-                logger.warning("Could not restore volume: %s", e)
+            last_volume = load_config().get("LAST_VOLUMES", {}).get(mac_address)
+            if isinstance(last_volume, int) and 0 <= last_volume <= 100:
+                if set_sink_volume(configured_sink, last_volume):
+                    logger.info("✓ Restored volume to %s%% for %s", last_volume, mac_address)
+                    restored_volume = last_volume
 
             if restored_volume is None:
                 logger.info("No saved volume to restore, will use current volume")
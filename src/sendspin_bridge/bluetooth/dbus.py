@@ -94,6 +94,28 @@ def _dbus_call_device_method(device_path: str | None, method_name: str) -> bool:
         return False
 
 
+def _dbus_set_device_property(device_path: str | None, property_name: str, value) -> bool:
+    """Write a single BlueZ Device1 property synchronously via dbus-python.
+
+    Used for the writable flags (``Trusted``, ``Blocked``).  Booleans must be
+    wrapped in ``dbus.Boolean`` — a bare Python bool marshals as int and BlueZ
+    rejects the type.  Returns True on success, False on error.
+    """
+    if not device_path or dbus is None:
+        return False
+    try:
+        bus = dbus.SystemBus()
+        device = bus.get_object("org.bluez", device_path)
+        props = dbus.Interface(device, "org.freedesktop.DBus.Properties")
+        if isinstance(value, bool):
+            value = dbus.Boolean(value)
+        props.Set("org.bluez.Device1", property_name, value)
+        return True
+    except Exception as e:
+        logger.debug("D-Bus Set %s failed: %s", property_name, e)
+        return False
+
+
 # A2DP Sink service class (audio output into the peer). Stable across BlueZ.
 A2DP_SINK_UUID = "0000110b-0000-1000-8000-00805f9b34fb"
 HANDSFREE_UUID = "0000111e-0000-1000-8000-00805f9b34fb"
@@ -12,6 +12,7 @@ import asyncio
 import logging
 import os
 import re
+import shutil
 import subprocess
 import threading
 import time
@@ -30,6 +31,7 @@ from sendspin_bridge.bluetooth.dbus import (
     _dbus_get_adapter_address,
     _dbus_get_device_property,
     _dbus_get_device_uuids,
+    _dbus_set_device_property,
     _dbus_wait_services_resolved,
 )
 from sendspin_bridge.services.bluetooth import bt_operation_lock as _bt_op_lock
@@ -60,8 +62,13 @@ logger = logging.getLogger(__name__)
 
 _bt_executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 4), thread_name_prefix="bt-blocking")
 
+# Resolved once at import: passing an absolute path lets subprocess skip the
+# per-spawn $PATH walk.  Falls back to the bare name so a bluetoothctl
+# installed after startup still works.
+_BTCTL = shutil.which("bluetoothctl") or "bluetoothctl"
+
 # Timing constants for BT operations
-_PAIRING_SCAN_DURATION = 12  # seconds to scan before pairing
+_PAIRING_SCAN_DURATION = 12  # max seconds to scan before pairing (exits early on discovery)
 _PAIRING_WAIT_DURATION = 10  # seconds to wait for pairing to complete
 _MAX_RECONNECT_DELAY_S = 300.0  # max backoff for reconnect attempts (5 min)
 _CONNECT_CHECK_RETRIES = 5  # status checks after connect before giving up
@@ -91,6 +98,57 @@ _RSSI_REFRESH_INTERVAL_S = 5.0
 # device object, force-remove the stale BlueZ entry so the next reconnect cycle
 # can escalate to pair_device (KALLSUP-class loop, #162).
 _PAIRED_UNKNOWN_THRESHOLD = 3
+# TTL caches for the connection/pairing probes.  is_device_connected is hit
+# from several contexts within the same few seconds (polling monitor,
+# connect_device's status-check loop, auto-reclaim, Flask status routes);
+# every fresh probe is a synchronous D-Bus round-trip — or a full
+# bluetoothctl fork on hosts without dbus-python.  Within the TTL window we
+# return the cached state instead.  The D-Bus PropertiesChanged path writes
+# ``self.connected`` directly, so a signal-driven transition is visible
+# immediately even while the probe cache is warm.
+_CONN_PROBE_TTL_S = 2.0
+_PAIRED_PROBE_TTL_S = 30.0
+
+# Adapter availability, cached briefly per adapter key ("" = default
+# controller).  Multi-device startup activates every configured device in
+# sequence and each activation probes the — usually shared — adapter with
+# a fresh bluetoothctl fork; within the TTL one probe answers all of them.
+_BT_AVAIL_TTL_S = 5.0
+_BT_AVAIL_CACHE: dict[str, tuple[float, bool]] = {}
+
+# hciN → adapter MAC mapping is stable for the life of the process; cache it
+# so repeated BluetoothManager construction (one per configured device) does
+# not redo the D-Bus — or worse, bluetoothctl — resolution every time.
+# Plain dict: get/set are GIL-atomic and a rare duplicate resolution is harmless.
+_ADAPTER_MAC_CACHE: dict[str, str] = {}
+
+# Companion caches for the other two adapter-resolution probes that run in
+# every BluetoothManager.__init__: the default-controller MAC (one
+# `bluetoothctl show` fork per construction otherwise) and the MAC → hciN
+# mapping (a sysfs directory walk, or a `bluetoothctl list` fork as last
+# resort).  Only successful resolutions are cached — a failure at early boot
+# (adapter not up yet) must stay retryable for devices constructed later.
+_DEFAULT_ADAPTER_MAC_CACHE: dict[str, str] = {}
+_HCI_NAME_CACHE: dict[str, str] = {}
+
+# Matches a colon-separated Bluetooth MAC anywhere in bluetoothctl output.
+# One compiled pattern shared by every 'Controller <MAC> ...' parse — a single
+# C-level scan per line instead of split()/count() over each word.
+_MAC_RE = re.compile(r"\b[0-9A-F]{2}(?::[0-9A-F]{2}){5}\b", re.IGNORECASE)
+
+# Case-insensitive token probes for bluetoothctl output.  A compiled
+# IGNORECASE search scans the buffer once in C, without the full lowercased
+# copy that `output.lower() ... in` allocated on every probe.
+_RE_PAIRED = re.compile(r"Paired:\s*(yes|no)", re.IGNORECASE)
+_RE_CONNECTED = re.compile(r"Connected:\s*(yes|no)", re.IGNORECASE)
+_RE_NOT_AVAILABLE = re.compile(r"not available", re.IGNORECASE)
+_RE_NO_DEFAULT_CONTROLLER = re.compile(r"no default controller", re.IGNORECASE)
+_RE_CONTROLLER = re.compile(r"controller", re.IGNORECASE)
+# 'Controller <MAC>' with the MAC captured — default-adapter detection.
+_RE_CONTROLLER_MAC = re.compile(r"Controller\s+([0-9A-Fa-f:]{17})")
+# Full-string validators for the two identifier shapes the manager handles.
+_RE_MAC_EXACT = re.compile(r"([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}")
+_RE_HCI_NAME = re.compile(r"^hci(\d+)$")
 
 
 def _summarize_bluetoothctl_connect_output(output: str) -> str:
@@ -203,6 +261,12 @@ class BluetoothManager:
         # this both could observe the pre-transition state and fire
         # ``on_connected`` twice — duplicate MprisPlayer registrations.
         self._connected_state_lock = threading.Lock()
+        # Probe caches (see _CONN_PROBE_TTL_S / _PAIRED_PROBE_TTL_S above).
+        # ``_conn_checked_at`` is the monotonic time of the last *fresh*
+        # connection probe; ``_paired_cache`` holds (timestamp, value) for
+        # the last definitive (non-None) pairing answer.
+        self._conn_checked_at: float = 0.0
+        self._paired_cache: tuple[float, bool] | None = None
         self.last_check: float = 0
         self.check_interval = check_interval
         self.max_reconnect_fails = max_reconnect_fails
@@ -355,16 +419,28 @@ class BluetoothManager:
         return True
 
     def _detect_default_adapter_mac(self) -> str:
-        """Return the MAC of the default Bluetooth controller, or empty string."""
+        """Return the MAC of the default Bluetooth controller, or empty string.
+
+        Cached at module scope after the first successful probe — every
+        configured device without an explicit adapter runs this in
+        ``__init__``, and the default controller does not change for the
+        life of the process.
+        """
+        cached = _DEFAULT_ADAPTER_MAC_CACHE.get("")
+        if cached:
+            return cached
         try:
             out = subprocess.check_output(
-                ["bluetoothctl", "show"],
+                [_BTCTL, "show"],
                 stderr=subprocess.DEVNULL,
                 timeout=5,
                 text=True,
             )
-            m = re.search(r"Controller\s+([0-9A-Fa-f:]{17})", out)
-            return m.group(1) if m else ""
+            m = _RE_CONTROLLER_MAC.search(out)
+            if m:
+                _DEFAULT_ADAPTER_MAC_CACHE[""] = m.group(1)
+                return m.group(1)
+            return ""
         except (OSError, subprocess.SubprocessError):
             return ""
 
@@ -413,6 +489,9 @@ class BluetoothManager:
         effective = (self.effective_adapter_mac or "").upper()
         if not effective:
             return ""
+        cached = _HCI_NAME_CACHE.get(effective)
+        if cached:
+            return cached
         # Prefer sysfs lookup — it maps MACs to hciN names without relying on
         # the ordering of 'bluetoothctl list' output which may not match hciN indices.
         mac_norm = effective.replace(":", "").lower()
@@ -423,22 +502,20 @@ class BluetoothManager:
                 if addr_file.exists():
                     addr = addr_file.read_text().strip().replace(":", "").lower()
                     if addr == mac_norm:
+                        _HCI_NAME_CACHE[effective] = hci.name
                         return hci.name
         except Exception as exc:
             logger.debug("sysfs adapter lookup failed: %s", exc)
         # Fallback: count adapter positions in bluetoothctl output (fragile, but last resort)
         try:
-            result = subprocess.run(["bluetoothctl", "list"], capture_output=True, text=True, timeout=5)
-            idx = 0
-            for line in result.stdout.splitlines():
-                if "Controller" not in line:
-                    continue
-                for part in line.split():
-                    if len(part) == 17 and part.count(":") == 5:
-                        if part.upper() == effective:
-                            return f"hci{idx}"
-                        idx += 1
-                        break
+            result = subprocess.run([_BTCTL, "list"], capture_output=True, text=True, timeout=5)
+            # One findall pass over the whole buffer — the 'Controller' prefix
+            # in the pattern keeps MACs inside adapter alias text from counting.
+            macs = [m.upper() for m in _RE_CONTROLLER_MAC.findall(result.stdout)]
+            if effective in macs:
+                hci_name = f"hci{macs.index(effective)}"
+                _HCI_NAME_CACHE[effective] = hci_name
+                return hci_name
         except Exception as exc:
             logger.debug("bluetoothctl adapter fallback failed: %s", exc)
         return ""
@@ -452,6 +529,9 @@ class BluetoothManager:
             idx = int(adapter[3:])  # N from hciN
         except ValueError:
             return adapter
+        cached = _ADAPTER_MAC_CACHE.get(adapter)
+        if cached:
+            return cached
         # BlueZ's D-Bus object path for an adapter is always /org/bluez/<hciN>,
         # which matches the kernel hci index unambiguously. Prefer this over
         # counting lines in `bluetoothctl list`, whose ordering reflects
@@ -461,24 +541,21 @@ class BluetoothManager:
         dbus_addr = _dbus_get_adapter_address(adapter)
         if dbus_addr:
             logger.info("Resolved adapter %s → %s", adapter, dbus_addr)
+            _ADAPTER_MAC_CACHE[adapter] = dbus_addr.upper()
             return dbus_addr.upper()
         try:
             result = subprocess.run(
-                ["bluetoothctl", "list"],
+                [_BTCTL, "list"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            # Parse "Controller <MAC> description [default]" lines
-            macs = []
-            for line in result.stdout.splitlines():
-                if "Controller" in line:
-                    for part in line.split():
-                        if len(part) == 17 and part.count(":") == 5:
-                            macs.append(part.upper())
-                            break
+            # Parse "Controller <MAC> description [default]" lines in one
+            # findall pass instead of splitlines + per-line searches.
+            macs = [m.upper() for m in _RE_CONTROLLER_MAC.findall(result.stdout)]
             if idx < len(macs):
                 logger.info("Resolved adapter %s → %s", adapter, macs[idx])
+                _ADAPTER_MAC_CACHE[adapter] = macs[idx]
                 return macs[idx]
         except (OSError, subprocess.SubprocessError) as e:
             logger.debug("Adapter MAC resolution failed: %s", e)
@@ -486,19 +563,39 @@ class BluetoothManager:
 
     def _run_bluetoothctl(self, commands: list) -> tuple[bool, str]:
         """Run bluetoothctl commands, prepending 'select <adapter_mac>' if configured.
-        Uses stdin pipe directly — no shell, no injection risk."""
+        Uses stdin pipe directly — no shell, no injection risk.
+
+        Keep this (and every other subprocess call in the bridge) free of
+        ``shell=True``, ``preexec_fn`` and ``close_fds=False``: with the
+        defaults CPython spawns via ``posix_spawn`` (vfork+execve), while any
+        of those kwargs silently drops it back to ``fork()`` — a full
+        page-table copy of the bridge process per call, which is measurable
+        on a Raspberry Pi with several players loaded."""
         try:
             all_commands = []
             if self._adapter_select:
                 all_commands.append(f"select {self._adapter_select}")
             all_commands.extend(commands)
+            # Explicit `quit` makes bluetoothctl exit as soon as the last
+            # command completes instead of lingering on stdin-EOF handling —
+            # shaves a few hundred ms of tail latency per call.
+            all_commands.append("quit")
             cmd_string = "\n".join(all_commands) + "\n"
+            # Scale the ceiling with the batch: quick queries (show/info/list)
+            # finish well under a second and shouldn't be able to stall a
+            # probe for the full worst case.  connect/disconnect/pair
+            # legitimately block for a BR/EDR page timeout, so those keep
+            # the old 10s ceiling.
+            if any(cmd.startswith(("connect", "disconnect", "pair")) for cmd in all_commands):
+                timeout_s = 10.0
+            else:
+                timeout_s = max(3.0, 2.0 + 0.5 * len(all_commands))
             result = subprocess.run(
-                ["bluetoothctl"],
+                [_BTCTL],
                 input=cmd_string,
                 capture_output=True,
                 text=True,
-                timeout=10,
+                timeout=timeout_s,
             )
             # BlueZ/bluetoothctl versions disagree on whether command failures
             # belong on stdout or stderr. Preserve both so reconnect warnings
@@ -507,24 +604,34 @@ class BluetoothManager:
             output = "\n".join(part.strip("\n") for part in (result.stdout, result.stderr) if part)
             return result.returncode == 0, output
         except subprocess.TimeoutExpired:
-            logger.warning("Bluetoothctl timed out after 10s for commands: %s", commands)
+            logger.warning("Bluetoothctl timed out after %.1fs for commands: %s", timeout_s, commands)
             return False, "timeout"
         except OSError as e:
             logger.error("Bluetoothctl error: %s", e)
             return False, str(e)
 
     def check_bluetooth_available(self) -> bool:
-        """Check if Bluetooth is available on the system"""
+        """Check if Bluetooth is available on the system (cached per adapter)."""
+        key = self.adapter or ""
+        cached = _BT_AVAIL_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _BT_AVAIL_TTL_S:
+            return cached[1]
+        ok = self._check_bluetooth_available_uncached()
+        _BT_AVAIL_CACHE[key] = (time.monotonic(), ok)
+        return ok
+
+    def _check_bluetooth_available_uncached(self) -> bool:
         try:
             if self.adapter:
                 # Check specific adapter via _run_bluetoothctl (includes select)
                 success, output = self._run_bluetoothctl(["show"])
                 return success and "Controller" in output
             # Default: check for any controller
-            result = subprocess.run(["bluetoothctl", "show"], capture_output=True, text=True, timeout=5)
+            result = subprocess.run([_BTCTL, "show"], capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
-                output_lower = result.stdout.lower()
-                return "controller" in output_lower and "no default controller" not in output_lower
+                return bool(_RE_CONTROLLER.search(result.stdout)) and not _RE_NO_DEFAULT_CONTROLLER.search(
+                    result.stdout
+                )
             return False
         except (OSError, subprocess.SubprocessError) as e:
             logger.error("Bluetooth not available: %s", e)
@@ -536,45 +643,93 @@ class BluetoothManager:
         Returns ``None`` when BlueZ cannot currently resolve the device object.
         That state is common immediately after disconnect/restart for some
         speakers and must not be treated as a hard "not paired" signal.
+
+        Definitive answers are cached for ``_PAIRED_PROBE_TTL_S`` — pairing
+        state only changes through pair_device / the stale-entry purge, both
+        of which invalidate the cache. ``None`` (unknown) is never cached.
         """
+        cached = self._paired_cache
+        if cached is not None and time.monotonic() - cached[0] < _PAIRED_PROBE_TTL_S:
+            return cached[1]
         val = _dbus_get_device_property(self._dbus_device_path, "Paired")
         if val is not None:
+            self._paired_cache = (time.monotonic(), bool(val))
             return bool(val)
-        _success, output = self._run_bluetoothctl([f"info {self.mac_address}"])
-        lowered = output.lower()
-        if "paired: yes" in lowered:
-            return True
-        if "paired: no" in lowered:
-            return False
-        if "not available" in lowered:
+        paired, connected, available = self._bluetoothctl_info_flags()
+        if connected is not None:
+            # The same `info` output answers the connection probe too —
+            # feed its cache so the next is_device_connected call doesn't
+            # immediately fork another one.
+            self._note_probed_connection_state(connected)
+        if paired is not None:
+            return paired
+        if not available:
             logger.info(
                 "[%s] Pairing state unknown: BlueZ has no current device object for %s",
                 self.device_name,
                 self.mac_address,
             )
-            return None
         return None
 
+    def _bluetoothctl_info_flags(self) -> tuple[bool | None, bool | None, bool]:
+        """Parse one ``bluetoothctl info`` run into ``(paired, connected, available)``.
+
+        Shared by the ``is_device_paired`` / ``is_device_connected`` fallbacks
+        so a single fork feeds both TTL caches when dbus-python is
+        unavailable.  Either flag is ``None`` when its line is missing from
+        the output; *available* is ``False`` when BlueZ reported the device
+        "not available".  Definitive pairing answers are cached here.
+        """
+        _success, output = self._run_bluetoothctl([f"info {self.mac_address}"])
+        paired: bool | None = None
+        match = _RE_PAIRED.search(output)
+        if match:
+            paired = match.group(1).lower() == "yes"
+        connected: bool | None = None
+        match = _RE_CONNECTED.search(output)
+        if match:
+            connected = match.group(1).lower() == "yes"
+        if paired is not None:
+            self._paired_cache = (time.monotonic(), paired)
+        return paired, connected, _RE_NOT_AVAILABLE.search(output) is None
+
+    def _note_probed_connection_state(self, is_connected: bool) -> None:
+        """Record a freshly probed connection answer: stamp the TTL cache,
+        log the transition, and apply the state (firing change callbacks)."""
+        self._conn_checked_at = time.monotonic()
+        if is_connected != self.connected:
+            if is_connected:
+                logger.info("✓ BT device %s (%s) connected", self.device_name, self.mac_address)
+            else:
+                logger.warning("✗ BT device %s (%s) disconnected", self.device_name, self.mac_address)
+        self._apply_connected_state(is_connected)
+
     def is_device_connected(self) -> bool:
-        """Check if device is currently connected via D-Bus; falls back to bluetoothctl."""
+        """Check if device is currently connected via D-Bus; falls back to bluetoothctl.
+
+        Fresh probes are rate-limited to one per ``_CONN_PROBE_TTL_S``; inside
+        the window the cached ``self.connected`` is returned (kept accurate by
+        the D-Bus signal path writing through ``_apply_connected_state``).
+        Explicit connect/disconnect calls reset the window so they always
+        observe live state.
+        """
+        now = time.monotonic()
+        if now - self._conn_checked_at < _CONN_PROBE_TTL_S:
+            return self.connected
         try:
             val = _dbus_get_device_property(self._dbus_device_path, "Connected")
             if val is not None:
                 is_connected = bool(val)
             else:
-                # D-Bus unavailable — fall back to bluetoothctl
-                success, output = self._run_bluetoothctl([f"info {self.mac_address}"])
-                is_connected = success and "Connected: yes" in output
-
-            if is_connected != self.connected:
-                if is_connected:
-                    logger.info("✓ BT device %s (%s) connected", self.device_name, self.mac_address)
-                else:
-                    logger.warning("✗ BT device %s (%s) disconnected", self.device_name, self.mac_address)
-            self._apply_connected_state(is_connected)
+                # D-Bus unavailable — one bluetoothctl info run answers both
+                # this probe and (via the shared parse) the pairing cache.
+                _paired, connected, _available = self._bluetoothctl_info_flags()
+                is_connected = bool(connected)
+            self._note_probed_connection_state(is_connected)
             return self.connected
         except Exception as e:
             logger.warning("Error checking Bluetooth connection: %s", e)
+            self._conn_checked_at = 0.0
             self._apply_connected_state(False)
             return False
 
@@ -582,7 +737,8 @@ class BluetoothManager:
         """Pair with the Bluetooth device.
 
         Uses a single long-running bluetoothctl session with stdin kept open:
-        1. Scan for 12s so BlueZ caches the device (required for 'pair' to work)
+        1. Scan until the device shows up in discovery output (12s ceiling) so
+           BlueZ caches the device (required for 'pair' to work)
         2. Pair + trust while device is still in cache / pairing mode
         The device MUST be in pairing/discoverable mode when this runs.
         Uses stdin pipe directly — no shell, no injection risk.
@@ -591,7 +747,7 @@ class BluetoothManager:
         prompts (e.g. ``Confirm passkey 312997 (yes/no):``).
         """
         mac = self.mac_address
-        if not re.fullmatch(r"([0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2}", mac):
+        if not _RE_MAC_EXACT.fullmatch(mac):
             logger.error("Invalid MAC address format: %s", mac)
             return False
 
@@ -629,7 +785,7 @@ class BluetoothManager:
         cleanup_cmds.append(f"remove {mac}")
         try:
             subprocess.run(
-                ["bluetoothctl"],
+                [_BTCTL],
                 input="\n".join(cleanup_cmds) + "\n",
                 capture_output=True,
                 text=True,
@@ -678,7 +834,7 @@ class BluetoothManager:
         proc = None
         try:
             proc = subprocess.Popen(
-                ["bluetoothctl"],
+                [_BTCTL],
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
@@ -696,8 +852,38 @@ class BluetoothManager:
 
             proc.stdin.write("\n".join(initial_cmds) + "\n")
             proc.stdin.flush()
-            if not self._wait_with_cancel(_PAIRING_SCAN_DURATION):
-                return False
+
+            import selectors
+
+            collected: list[str] = []
+
+            # Event-driven discovery window: bluetoothctl streams [NEW]/[CHG]
+            # Device lines as BlueZ discovers peers, so watch its stdout for
+            # our MAC and move on to `pair` the moment the device appears
+            # instead of sitting out the full scan window.
+            # _PAIRING_SCAN_DURATION remains the worst-case ceiling for
+            # devices that are slow to start advertising.
+            sel = selectors.DefaultSelector()
+            sel.register(proc.stdout, selectors.EVENT_READ)  # type: ignore[arg-type]
+            try:
+                mac_lower = mac.lower()
+                scan_deadline = time.monotonic() + _PAIRING_SCAN_DURATION
+                while time.monotonic() < scan_deadline and proc.poll() is None:
+                    if self._reconnect_cancelled():
+                        return False
+                    events = sel.select(timeout=min(0.5, max(0.0, scan_deadline - time.monotonic())))
+                    if not events:
+                        continue
+                    line = proc.stdout.readline()  # type: ignore[union-attr]
+                    if not line:
+                        break
+                    collected.append(line)
+                    lowered = line.lower()
+                    if mac_lower in lowered and "device" in lowered:
+                        logger.info("[%s] Device appeared during scan — pairing immediately", self.device_name)
+                        break
+            finally:
+                sel.close()
 
             # Re-apply per-adapter Class of Device override just before the
             # outbound BR/EDR Connect — Samsung Q-series soundbars filter
@@ -713,12 +899,9 @@ class BluetoothManager:
             # Read stdout in real-time to detect and answer SSP passkey prompts.
             # Only trust the device after pair succeeded; trusting too early can
             # leave BlueZ with a stale Trusted=yes, Paired=no entry.
-            collected: list[str] = []
             paired_ok = False
             pin_attempted = False
             deadline = time.monotonic() + _PAIRING_WAIT_DURATION
-            import selectors
-
             sel = selectors.DefaultSelector()
             sel.register(proc.stdout, selectors.EVENT_READ)  # type: ignore[arg-type]
             try:
@@ -777,6 +960,7 @@ class BluetoothManager:
                 or "paired: yes" in out.lower()
             )
             self.paired = ok
+            self._paired_cache = (time.monotonic(), ok)
             if native_agent is not None:
                 try:
                     telemetry = native_agent.telemetry
@@ -890,7 +1074,15 @@ class BluetoothManager:
                 logger.debug("[%s] Post-pair status update failed: %s", self.device_name, exc)
 
     def trust_device(self) -> bool:
-        """Trust the Bluetooth device"""
+        """Trust the Bluetooth device via D-Bus; falls back to bluetoothctl.
+
+        ``Trusted`` is a plain writable Device1 property, so setting it over
+        D-Bus skips the subprocess entirely — same pattern as
+        ``disconnect_device``.  The bluetoothctl fallback covers hosts
+        without dbus-python or where BlueZ has no device object yet.
+        """
+        if _dbus_set_device_property(self._dbus_device_path, "Trusted", True):
+            return True
         success, _ = self._run_bluetoothctl([f"trust {self.mac_address}"])
         return success
 
@@ -898,6 +1090,23 @@ class BluetoothManager:
         """Configure host's PipeWire/PulseAudio to use the Bluetooth device as audio output"""
         if self._reconnect_cancelled():
             return False
+        # Fast path: the host already tracks a sink for this device — repeat
+        # calls (connect_device on an already-connected device, monitor
+        # re-checks) can skip the whole discovery/volume-restore dance.  One
+        # get_sink_volume round-trip confirms the sink is still live; a stale
+        # name falls through to full discovery.
+        host_sink = getattr(self.host, "bluetooth_sink_name", None) if self.host else None
+        if host_sink:
+            pa_mac = self.mac_address.replace(":", "_")
+            if (pa_mac in host_sink or self.mac_address in host_sink) and (
+                bt_audio.get_sink_volume(host_sink) is not None
+            ):
+                logger.debug(
+                    "[%s] Audio sink %s already configured and live — skipping rediscovery",
+                    self.device_name,
+                    host_sink,
+                )
+                return True
         return bt_audio.configure_bluetooth_audio(
             mac_address=self.mac_address,
             prefer_sbc=self.prefer_sbc,
@@ -920,7 +1129,9 @@ class BluetoothManager:
             if self._abort_connect_if_cancelled():
                 return False
             return self.is_device_connected()
-        # Fresh top-level connect cycle gets one A2DP recovery dance credit.
+        # Fresh top-level connect cycle gets one A2DP recovery dance credit,
+        # and always starts from a live connection probe.
+        self._conn_checked_at = 0.0
         self._a2dp_dance_remaining = 1
         try:
             return self._connect_device_inner()
@@ -962,13 +1173,12 @@ class BluetoothManager:
         if self._abort_connect_if_cancelled():
             return False
 
-        # Power on bluetooth
-        self._run_bluetoothctl(["power on"])
-        if not self._wait_with_cancel(1):
-            return False
-
-        # Try to connect
-        _success, _connect_output = self._run_bluetoothctl([f"connect {self.mac_address}"])
+        # Power on and connect in a single bluetoothctl session.  The commands
+        # run sequentially over one D-Bus connection, so the adapter is powered
+        # before `connect` is issued — no need for a second fork or the settle
+        # wait the old two-session sequence carried between them.
+        _success, _connect_output = self._run_bluetoothctl(["power on", f"connect {self.mac_address}"])
+        self._conn_checked_at = 0.0  # status-check loop below must probe live state
         if self._abort_connect_if_cancelled():
             return False
 
@@ -1081,13 +1291,14 @@ class BluetoothManager:
             self.mac_address,
             _PAIRED_UNKNOWN_THRESHOLD,
         )
+        self._paired_cache = None
         cleanup_cmds: list[str] = []
         if self._adapter_select:
             cleanup_cmds.append(f"select {self._adapter_select}")
         cleanup_cmds.append(f"remove {self.mac_address}")
         try:
             subprocess.run(
-                ["bluetoothctl"],
+                [_BTCTL],
                 input="\n".join(cleanup_cmds) + "\n",
                 capture_output=True,
                 text=True,
@@ -1126,6 +1337,7 @@ class BluetoothManager:
 
     def disconnect_device(self) -> bool:
         """Disconnect from the Bluetooth device via D-Bus; falls back to bluetoothctl."""
+        self._conn_checked_at = 0.0
         if _dbus_call_device_method(self._dbus_device_path, "Disconnect"):
             self._apply_connected_state(False)
             return True
@@ -1249,7 +1461,9 @@ class BluetoothManager:
         if self._abort_connect_if_cancelled():
             return False
         # Reconnect and re-issue the explicit A2DP Sink profile request.
-        self._run_bluetoothctl([f"connect {self.mac_address}"])
+        # Same D-Bus-first/bluetoothctl-fallback shape as the disconnect above.
+        if not _dbus_call_device_method(self._dbus_device_path, "Connect"):
+            self._run_bluetoothctl([f"connect {self.mac_address}"])
         for _i in range(_CONNECT_CHECK_RETRIES):
             if not self._wait_with_cancel(1):
                 return False
@@ -1566,7 +1780,7 @@ class BluetoothManager:
         hci_name = self.adapter_hci_name
         if not adapter_mac or not hci_name:
             return False
-        m = re.match(r"^hci(\d+)$", hci_name)
+        m = _RE_HCI_NAME.match(hci_name)
         if not m:
             return False
         hci_index = int(m.group(1))
@@ -1640,7 +1854,7 @@ class BluetoothManager:
         """
         if not self.adapter_hci_name:
             return -1
-        m = re.match(r"^hci(\d+)$", self.adapter_hci_name)
+        m = _RE_HCI_NAME.match(self.adapter_hci_name)
         if not m:
             return -1
         return int(m.group(1))
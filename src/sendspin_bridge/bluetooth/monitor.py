@@ -27,6 +27,23 @@ logger = logging.getLogger(__name__)
 # Gives PulseAudio time to create the new sink and module-rescue-streams to act.
 _SINK_CORRECTION_DELAY = 3
 
+# Per-adapter serialisation for monitor-driven reconnect attempts.  BlueZ
+# pages one BR/EDR peer at a time per controller, so when several devices on
+# the same hciN drop together (adapter flap), firing their connect_device
+# calls concurrently only adds D-Bus contention and stretches every attempt's
+# wall time.  The wait happens on the event loop — an asyncio.Lock here keeps
+# the queued reconnects from pinning bt-executor worker threads the way a
+# threading.Lock inside connect_device would.  All monitor tasks run on the
+# orchestrator's single loop, so plain module-level locks are safe.
+_adapter_reconnect_locks: dict[str, asyncio.Lock] = {}
+
+
+def _adapter_reconnect_lock(mgr: BluetoothManager) -> asyncio.Lock:
+    """Return the shared reconnect lock for *mgr*'s effective adapter."""
+    key = (mgr.effective_adapter_mac or "").upper()
+    return _adapter_reconnect_locks.setdefault(key, asyncio.Lock())
+
+
 # Strong references to fire-and-forget background tasks.  A bare
 # ``asyncio.ensure_future`` keeps no reference, so the event loop may garbage
 # collect the task mid-flight and any exception it raises is silently dropped.
@@ -240,7 +257,8 @@ async def _monitor_polling(mgr: BluetoothManager) -> None:
                         await mgr.host.stop_subprocess()
 
                     _log_reconnect_attempt(mgr.device_name, reconnect_attempt)
-                    success = await loop.run_in_executor(_bt_executor, mgr.connect_device)
+                    async with _adapter_reconnect_lock(mgr):
+                        success = await loop.run_in_executor(_bt_executor, mgr.connect_device)
                     if mgr._reconnect_cancelled():
                         reconnect_attempt = 0
                         continue
@@ -287,7 +305,9 @@ async def _monitor_polling(mgr: BluetoothManager) -> None:
 
                     # Read battery level (None if device doesn't support it).
                     # Synchronous D-Bus round-trip → run off the loop.
-                    mgr.battery_level = await loop.run_in_executor(None, _dbus_get_battery_level, mgr._dbus_device_path)
+                    mgr.battery_level = await loop.run_in_executor(
+                        _bt_executor, _dbus_get_battery_level, mgr._dbus_device_path
+                    )
 
             await asyncio.sleep(5)
         except Exception:
@@ -512,7 +532,9 @@ async def _inner_dbus_monitor(
                 except Exception as exc:
                     logger.debug("heartbeat connected-state check failed: %s", exc)
                 # Read battery level during heartbeat
-                mgr.battery_level = await loop.run_in_executor(None, _dbus_get_battery_level, mgr._dbus_device_path)
+                mgr.battery_level = await loop.run_in_executor(
+                    _bt_executor, _dbus_get_battery_level, mgr._dbus_device_path
+                )
         else:
             # Device is disconnected — attempt reconnect
             mgr.battery_level = None
@@ -556,7 +578,8 @@ async def _inner_dbus_monitor(
                 await mgr.host.stop_subprocess()
 
             _log_reconnect_attempt(mgr.device_name, reconnect_attempt)
-            success = await loop.run_in_executor(_bt_executor, mgr.connect_device)
+            async with _adapter_reconnect_lock(mgr):
+                success = await loop.run_in_executor(_bt_executor, mgr.connect_device)
             if mgr._reconnect_cancelled():
                 reconnect_attempt = 0
                 continue
@@ -7,11 +7,13 @@ Runs the sendspin CLI player with Bluetooth speaker management
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import math
 import os
 import random
+import re
 import shutil
 import socket
 import struct
@@ -28,16 +30,15 @@ if TYPE_CHECKING:
 
 import sendspin_bridge.bridge.state as _state
 from sendspin_bridge.bluetooth.dbus import _dbus_get_device_property, _dbus_get_media_transport_snapshot
-from sendspin_bridge.bluetooth.manager import BluetoothManager
+from sendspin_bridge.bluetooth.manager import BluetoothManager, _bt_executor
 from sendspin_bridge.bluetooth.vendor_map import vendor_from_modalias
 from sendspin_bridge.bridge.exceptions import IPCError
 from sendspin_bridge.bridge.orchestrator import BridgeOrchestrator
 from sendspin_bridge.config import (
-    CONFIG_FILE,
     CONFIG_SCHEMA_VERSION,
     _player_id_from_mac,
-    config_lock,
     get_runtime_version,
+    load_config,
     save_device_static_delay,
     save_device_volume,
 )
@@ -330,6 +331,19 @@ def _generate_infrasound_burst() -> bytes:
 
 _KEEPALIVE_METHODS = ("infrasound", "silence", "none")
 
+# Everything that is not alphanumeric-or-dash gets folded to '-'.  ``\w``
+# covers unicode alphanumerics but also underscore, which must be folded like
+# any other separator — hence the extra ``|_`` alternative.  A single C-level
+# re.sub replaces the old per-character Python generator; memoized because a
+# player's name is immutable for the life of its client.
+_SAFE_ID_SUB = re.compile(r"[^\w-]|_").sub
+
+
+@functools.lru_cache(maxsize=64)
+def _safe_player_id(player_name: str) -> str:
+    """Return *player_name* lowercased with non-alphanumeric runs dashed."""
+    return _SAFE_ID_SUB("-", player_name.lower()).strip("-")
+
 
 def _generate_keepalive_buffer(method: str) -> bytes:
     """Return the PCM payload for the configured ``keep_alive_method``.
@@ -602,11 +616,14 @@ def _filter_duplicate_bluetooth_devices(devices: list[dict]) -> list[dict]:
 
 
 def _load_saved_device_volume(mac: str) -> int | None:
-    """Read LAST_VOLUMES from config so the UI has a volume before BT reconnects."""
+    """Read LAST_VOLUMES from config so the UI has a volume before BT reconnects.
+
+    Goes through ``load_config()`` rather than re-opening config.json —
+    the loader is stat-stamp cached, so the once-per-device calls during
+    startup parse the file once instead of once per configured device.
+    """
     try:
-        with config_lock, open(CONFIG_FILE) as config_file:
-            saved_config = json.load(config_file)
-        saved_volume = saved_config.get("LAST_VOLUMES", {}).get(mac)
+        saved_volume = load_config().get("LAST_VOLUMES", {}).get(mac)
         if isinstance(saved_volume, int) and 0 <= saved_volume <= 100:
             return saved_volume
     except Exception as exc:
@@ -685,9 +702,15 @@ class SendspinClient:
 
         self._status_lock = threading.Lock()
         self.running = False
-        # Compute player_id: stable UUID5 from MAC (preferred) or player name
+        # Created by run() on its event loop; set by stop() so the run loop
+        # parks on an Event instead of polling ``self.running`` at 1 Hz.
+        self._stopped: asyncio.Event | None = None
+        # Compute player_id: stable UUID5 from MAC (preferred) or player name.
+        # Cached for the client's lifetime — the manager never changes MAC —
+        # so per-message paths don't re-read it through two attribute hops.
         _mac = bt_manager.mac_address if bt_manager else None
-        safe_id = "".join(c if c.isalnum() or c == "-" else "-" for c in player_name.lower()).strip("-")
+        self._bt_mac: str | None = _mac
+        safe_id = _safe_player_id(player_name)
         self._safe_id = safe_id
         self.player_id: str = (
             _player_id_from_mac(_mac)
@@ -734,6 +757,10 @@ class SendspinClient:
         # delay debounce independently.
         self._persist_timers: dict[str, threading.Timer] = {}
         self._persist_timers_lock = threading.Lock()
+        # Last value successfully written per persist key — lets the
+        # debounce skip redundant config fsyncs when a ramp lands back on
+        # the already-persisted value (e.g. a 50→80→50 slider round trip).
+        self._last_persisted: dict[str, int] = {}
         self._idle_timer_lock = threading.Lock()
         self._idle_timer_task: asyncio.Task | concurrent.futures.Future | None = None
         self._power_save_timer_task: asyncio.Task | concurrent.futures.Future | None = None
@@ -1210,7 +1237,7 @@ class SendspinClient:
             self.bt_manager.signal_standby_wake()
             # Kick off BT connect directly — don't wait for bt_monitor's loop.
             loop = asyncio.get_running_loop()
-            loop.run_in_executor(None, self.bt_manager.connect_device)
+            loop.run_in_executor(_bt_executor, self.bt_manager.connect_device)
         _state.publish_device_event(
             self._event_device_id(),
             DeviceEventType.BLUETOOTH_STANDBY_EXITED,
@@ -1605,7 +1632,7 @@ class SendspinClient:
             # during sink discovery retries — up to ~18 s).
             if self.bt_manager and self.bt_manager.connected and not self.bluetooth_sink_name:
                 loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.bt_manager.configure_bluetooth_audio)
+                await loop.run_in_executor(_bt_executor, self.bt_manager.configure_bluetooth_audio)
 
             # Phase 2 standby wake: daemon is alive on null sink — reroute streams
             # to the BT sink instead of spawning a new subprocess.
@@ -1751,7 +1778,9 @@ class SendspinClient:
                     return name, manufacturer
 
                 loop = asyncio.get_running_loop()
-                bt_product_name, bt_manufacturer = await loop.run_in_executor(None, _read_bt_identity, bt_dbus_path)
+                bt_product_name, bt_manufacturer = await loop.run_in_executor(
+                    _bt_executor, _read_bt_identity, bt_dbus_path
+                )
 
             params = json.dumps(
                 with_protocol_version(
@@ -1842,19 +1871,47 @@ class SendspinClient:
             old = self._persist_timers.pop(key, None)
             if old is not None:
                 old.cancel()
-            timer = threading.Timer(self._PERSIST_DEBOUNCE_SECS, self._run_persist, args=(key, fn, mac, value))
+            if old is None and self._last_persisted.get(key) == value:
+                # Back to the on-disk value with nothing in flight.  The skip
+                # is only safe when no timer was registered: ``Timer.cancel()``
+                # is a no-op once the callback has started, so a popped timer
+                # may still be mid-write with an intermediate value — always
+                # schedule the trailing write in that case so the newest value
+                # wins (the underlying ``update_config`` no-ops unchanged
+                # values, so a redundant write costs a read + compare).
+                return
+            timer = threading.Timer(
+                self._PERSIST_DEBOUNCE_SECS,
+                # The lambda closes over ``timer`` so _run_persist can verify
+                # it is still the registered owner of ``key`` when it fires.
+                lambda: self._run_persist(key, fn, mac, value, timer),
+            )
             timer.daemon = True
             self._persist_timers[key] = timer
             timer.start()
 
-    def _run_persist(self, key: str, fn, mac: str, value: int) -> None:
+    def _run_persist(self, key: str, fn, mac: str, value: int, timer: threading.Timer) -> None:
         # Runs on the Timer's own thread — the fsync never touches the loop.
-        # Stale entries are replaced by the next ``_schedule_persist`` and
-        # cleared by ``_cancel_persist_timers``, so no cleanup is needed here.
+        with self._persist_timers_lock:
+            if self._persist_timers.get(key) is not timer:
+                # Superseded after firing: a newer _schedule_persist popped us
+                # between the callback starting and this check.  The newer
+                # timer owns the key — writing here would let a stale
+                # intermediate value land after the latest one.
+                return
+            # Deliberately left registered while the write runs: a concurrent
+            # _schedule_persist must see an in-flight timer (old is not None)
+            # so it always schedules its trailing write instead of trusting
+            # _last_persisted, which we only update after fn() returns.
         try:
             fn(mac, value)
         except Exception:  # pragma: no cover - best-effort persistence
             logger.exception("[%s] failed to persist %s=%s", self.player_name, key, value)
+            return
+        with self._persist_timers_lock:
+            self._last_persisted[key] = value
+            if self._persist_timers.get(key) is timer:
+                del self._persist_timers[key]
 
     def _cancel_persist_timers(self) -> None:
         """Cancel any pending debounced writes (called on stop/teardown)."""
@@ -1892,18 +1949,22 @@ class SendspinClient:
             if msg is None:
                 continue
             if msg.get("type") == "status":
+                # The daemon emits full status envelopes, so ``updates``
+                # carries every key on every message — gate transition
+                # actions on the pre-update value, not mere key presence.
+                was_connected = bool(self.status.get("server_connected"))
                 # handle_message applies updates atomically via _update_status;
                 # use the returned updates dict to detect volume changes without
                 # separate lock acquisitions that could race.
                 updates = self._ipc_service.handle_message(msg)
                 if updates:
-                    if updates.get("server_connected") is True:
+                    if updates.get("server_connected") is True and not was_connected:
                         self._clear_ma_reconnecting()
                     # Auto-wake: MA started playback while daemon is on null sink
                     if updates.get("playing") is True and self.status.get("bt_standby"):
                         asyncio.ensure_future(self._on_standby_play_detected())
                     new_volume = updates.get("volume")
-                    _mac = self.bt_manager.mac_address if self.bt_manager else None
+                    _mac = self._bt_mac
                     if isinstance(new_volume, int) and _mac:
                         self._schedule_persist("volume", save_device_volume, _mac, new_volume)
                     # MA-driven static_delay_ms changes flow through the daemon's
@@ -2225,7 +2286,7 @@ class SendspinClient:
             path = getattr(self.bt_manager, "_dbus_device_path", None)
             if path:
                 snapshot = await asyncio.get_running_loop().run_in_executor(
-                    None, _dbus_get_media_transport_snapshot, path
+                    _bt_executor, _dbus_get_media_transport_snapshot, path
                 )
                 codec_name = (
                     snapshot.codec_name
@@ -2607,6 +2668,7 @@ class SendspinClient:
     async def run(self) -> None:
         """Main run loop — connects BT, starts subprocess, monitors health."""
         self.running = True
+        self._stopped = asyncio.Event()
         self._start_sendspin_lock = asyncio.Lock()
         self._start_sendspin_requests = 0
         self._start_sendspin_processed = 0
@@ -2641,7 +2703,7 @@ class SendspinClient:
                 try:
                     # Run in thread pool to avoid blocking
                     loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(None, self.bt_manager.connect_device)
+                    await loop.run_in_executor(_bt_executor, self.bt_manager.connect_device)
                     bt_now = self.bt_manager.is_device_connected()
                     if bt_now != self.status["bluetooth_connected"]:
                         self._update_status(
@@ -2698,9 +2760,12 @@ class SendspinClient:
             tasks.append(asyncio.create_task(self._transport_telemetry_loop()))
 
         try:
-            # Keep running
-            while self.running:
-                await asyncio.sleep(1)
+            # Park until stop() fires the event.  The old
+            # ``while self.running: await asyncio.sleep(1)`` woke every
+            # player once a second just to re-check a flag — with several
+            # players that defeats kernel tickless idling on low-power hosts.
+            if self.running:
+                await self._stopped.wait()
         except asyncio.CancelledError:
             logger.info("Client shutting down...")
         finally:
@@ -2712,6 +2777,8 @@ class SendspinClient:
     async def stop(self) -> None:
         """Stop the client and its subprocess."""
         self.running = False
+        if self._stopped is not None:
+            self._stopped.set()
 
     def set_bt_management_enabled(self, enabled: bool) -> None:
         """Release (enabled=False) or reclaim (enabled=True) the BT adapter."""
@@ -488,10 +488,26 @@ class BridgeOrchestrator:
         if muted:
             logger.info("Muted %d sink(s): %s", len(muted), ", ".join(muted))
 
-        for client in shutdown_clients:
-            client.running = False
+        async def _stop_client(client: Any) -> None:
+            await client.stop()
             await client.stop_sendspin()
 
+        # Stop clients concurrently: each graceful daemon stop can wait up
+        # to 3 s before the kill fallback, and serial shutdown multiplied
+        # that by the device count.  One failing client must not strand
+        # the others' daemons holding their listen ports.
+        results = await asyncio.gather(
+            *(_stop_client(client) for client in shutdown_clients),
+            return_exceptions=True,
+        )
+        for client, result in zip(shutdown_clients, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "[%s] Error during client shutdown: %s",
+                    getattr(client, "player_name", "?"),
+                    result,
+                )
+
         if sink_monitor is not None:
             await sink_monitor.stop()
         if hci_monitor is not None:
@@ -633,6 +649,17 @@ class BridgeOrchestrator:
         # device via POST /api/config (online activation path).
         set_activation_context(activation_context)
 
+        # Two-pass port reservation: collect every explicit ``listen_port``
+        # pin up front so the ``base_listen_port + index`` fallback inside
+        # ``activate_device`` never lands on a port a later device has
+        # pinned (which used to produce a silent bind failure only caught
+        # by the post-activation warning pass below).  Auto-assigned ports
+        # join the set as they are handed out so shifted fallbacks can't
+        # collide with each other either.
+        reserved_ports: set[int] = {
+            int(d["listen_port"]) for d in bt_devices if d.get("enabled", True) and d.get("listen_port")
+        }
+
         for index, device in enumerate(bt_devices):
             mac = str(device.get("mac") or "")
             adapter = str(device.get("adapter") or "")
@@ -677,7 +704,9 @@ class BridgeOrchestrator:
                 index=index,
                 context=activation_context,
                 default_player_name=resolved_default_name,
+                reserved_ports=reserved_ports,
             )
+            reserved_ports.add(result.listen_port)
             clients.append(result.client)
             logger.info("  Player: '%s', BT: %s, Adapter: %s", player_name, mac or "none", adapter or "default")
 
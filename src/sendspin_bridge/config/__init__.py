@@ -476,8 +476,34 @@ def save_device_buffer_setting(mac: str | None, field: str, value_ms: int) -> No
         logger.warning("Could not save %s for %s: %s", field, mac, exc)
 
 
+# Parsed-config cache keyed by the config file's (mtime_ns, size).  Status
+# and config web routes call load_config() on every request; without the
+# cache each call re-reads, re-parses and re-migrates an unchanged file.
+# Writers go through write_config_file's atomic os.replace(), which bumps
+# mtime and invalidates the stamp naturally.  Callers receive a deepcopy so
+# mutating a returned config can never leak into the cache.
+_load_config_cache: tuple[tuple[int, int], dict] | None = None
+
+
 def load_config() -> dict:
-    """Load configuration from file, falling back to defaults."""
+    """Load configuration from file, falling back to defaults (stat-cached)."""
+    global _load_config_cache
+    try:
+        st = CONFIG_FILE.stat()
+        stamp: tuple[int, int] | None = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    if stamp is not None:
+        cached = _load_config_cache
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+    result = _load_config_uncached()
+    if stamp is not None:
+        _load_config_cache = (stamp, copy.deepcopy(result))
+    return result
+
+
+def _load_config_uncached() -> dict:
     result = copy.deepcopy(DEFAULT_CONFIG)
     has_explicit_ha_area_name_assist = False
 
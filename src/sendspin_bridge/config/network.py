@@ -121,11 +121,28 @@ def resolve_base_listen_port(*, env: Mapping[str, str] | None = None, hostname:
     return default_port
 
 
+# get_local_ip is hit from every SendspinClient plus the status routes; each
+# probe is a routing-table walk (no packets are sent — connect() on a UDP
+# socket only binds the source address).  The primary IP rarely changes
+# mid-run, so cache the answer briefly instead of probing per call.  The TTL
+# keeps a DHCP renew or interface flap from being masked for long.
+_LOCAL_IP_TTL_S = 60.0
+_local_ip_cache: tuple[float, str] | None = None
+
+
 def get_local_ip() -> str:
-    """Return the primary local IP address via a UDP socket probe."""
+    """Return the primary local IP address via a cached UDP socket probe."""
+    global _local_ip_cache
+    import time
+
+    cached = _local_ip_cache
+    if cached is not None and time.monotonic() - cached[0] < _LOCAL_IP_TTL_S:
+        return cached[1]
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
-            return s.getsockname()[0]
+            ip = s.getsockname()[0]
     except OSError:
         return ""
+    _local_ip_cache = (time.monotonic(), ip)
+    return ip
@@ -27,6 +27,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Minimum gap between PA sink writes when set_state is called in a burst
+# (MA volume-slider drags arrive as dozens of commands per second).  The
+# first call applies immediately; later calls inside the window coalesce
+# into one trailing write of the latest requested state.
+_APPLY_COALESCE_S = 0.05
+
 
 class PulseVolumeController:
     """VolumeController backed by a PulseAudio/PipeWire sink.
@@ -60,6 +66,10 @@ class PulseVolumeController:
         # web UI slider tracks the speaker's physical volume knob.
         self._external_change_tap: VolumeChangeCallback | None = None
         self._monitor_task: asyncio.Task | None = None
+        # Latest requested (volume, muted) not yet written to PA, plus the
+        # self-terminating task draining it (see ``_apply_pending``).
+        self._pending_state: tuple[int, bool] | None = None
+        self._apply_task: asyncio.Task | None = None
 
     def set_external_change_tap(self, tap: VolumeChangeCallback | None) -> None:
         """Install (or clear) a parallel observer for external sink state.
@@ -70,14 +80,41 @@ class PulseVolumeController:
         self._external_change_tap = tap
 
     async def set_state(self, volume: int, *, muted: bool) -> None:
-        """Apply volume and mute state to the PA sink."""
+        """Apply volume and mute state to the PA sink.
+
+        Burst-coalesced: a rapid slider drag records only the latest
+        requested state and wakes a single applier task, so N commands
+        inside one ``_APPLY_COALESCE_S`` window become one PA write
+        instead of N.  The first call in a quiet period still applies
+        immediately (no added latency on isolated changes).
+        """
         vol = max(0, min(100, volume))
-        ok_vol = await aset_sink_volume(self._sink_name, vol)
-        ok_mute = await aset_sink_mute(self._sink_name, muted)
-        if ok_vol or ok_mute:
-            self._volume = vol
-            self._muted = muted
-            logger.debug("PA sink %s → vol=%d%% muted=%s", self._sink_name, vol, muted)
+        self._pending_state = (vol, muted)
+        if self._apply_task is None or self._apply_task.done():
+            self._apply_task = asyncio.create_task(
+                self._apply_pending(),
+                name=f"pa-volume-apply:{self._sink_name}",
+            )
+
+    async def _apply_pending(self) -> None:
+        """Drain ``_pending_state`` to PA, sleeping between burst writes.
+
+        Self-terminating: exits once no new state arrived during the last
+        coalesce window, so idle periods hold no task alive.
+        """
+        while True:
+            pending = self._pending_state
+            if pending is None:
+                return
+            self._pending_state = None
+            vol, muted = pending
+            ok_vol = await aset_sink_volume(self._sink_name, vol)
+            ok_mute = await aset_sink_mute(self._sink_name, muted)
+            if ok_vol or ok_mute:
+                self._volume = vol
+                self._muted = muted
+                logger.debug("PA sink %s → vol=%d%% muted=%s", self._sink_name, vol, muted)
+            await asyncio.sleep(_APPLY_COALESCE_S)
 
     async def get_state(self) -> tuple[int, bool]:
         """Read current volume and mute state from the PA sink."""
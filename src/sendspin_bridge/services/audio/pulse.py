@@ -3,10 +3,13 @@
 Replaces all subprocess ``pactl`` calls with native PA API calls.
 Both sync wrappers (safe from any thread) and async coroutines are provided.
 
-Design note: each call creates a fresh PulseAsync() context rather than keeping
-a persistent connection.  This simplifies error recovery (no stale-connection
-handling) at the cost of slightly higher overhead per call.  The volume-persist
-debounce in routes/api.py limits call frequency in practice.
+Design note: the one-shot helpers share a lazily-opened, per-event-loop
+PulseAsync connection (see ``_pulse_conn``) instead of paying a fresh
+socket connect + handshake per call.  Error recovery stays simple: any
+exception escaping an operation drops the cached connection, so the next
+caller reconnects from scratch.  Long-blocking subscribers (e.g.
+``await_sink_appearance``) keep their own dedicated connection so they
+never starve the shared one.
 
 Graceful fallback: if pulsectl_asyncio is unavailable (import error or
 libpulse0 not installed), every function falls back to the equivalent
@@ -18,7 +21,10 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import contextlib
 import logging
+import re
+import shutil
 import subprocess
 import threading
 from typing import Any
@@ -37,6 +43,7 @@ __all__ = [
     "areload_bluez5_discover_module",
     "aset_card_profile",
     "asuspend_sink",
+    "await_sink_appearance",
     "cycle_card_profile",
     "ensure_null_sink",
     "get_server_name",
@@ -52,6 +59,7 @@ __all__ = [
     "set_sink_mute",
     "set_sink_volume",
     "suspend_sink",
+    "wait_for_sink",
 ]
 
 # ---------------------------------------------------------------------------
@@ -67,22 +75,77 @@ except (ImportError, OSError) as _err:
     _PULSECTL_AVAILABLE = False
     logger.warning("pulsectl_asyncio unavailable (%s) — falling back to pactl subprocess", _err)
 
+# Resolved once at import so pactl fallback spawns skip the $PATH walk.
+_PACTL = shutil.which("pactl") or "pactl"
+
+# First "NN%" in ``pactl get-sink-volume`` output (the front-left channel).
+_VOLUME_PCT_RE = re.compile(r"(\d+)%")
+
 _CLIENT_NAME = "sendspin-bridge"
 _TIMEOUT = 5.0  # seconds for any PA operation
 
 
+# ---------------------------------------------------------------------------
+# Shared connection
+# ---------------------------------------------------------------------------
+
+# One lazily-opened PulseAsync per event loop, reused across the one-shot
+# helpers below.  Keyed by loop because the sync wrappers drive their own
+# thread-local loops (see ``_run``) and a libpulse connection must not be
+# shared across loops.  A per-loop lock serializes operations: libpulse
+# does not tolerate interleaved commands on one connection.
+_pulse_conns: dict[Any, Any] = {}
+_pulse_locks: dict[Any, asyncio.Lock] = {}
+
+
+@contextlib.asynccontextmanager
+async def _pulse_conn():
+    """Yield the shared per-loop ``PulseAsync``, (re)connecting as needed.
+
+    Any exception escaping the block — including the cancellation raised
+    by an expired ``asyncio.timeout`` — drops the cached connection, so
+    the next caller starts from a clean handshake instead of inheriting a
+    wedged socket.
+    """
+    loop = asyncio.get_running_loop()
+    lock = _pulse_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pulse = _pulse_conns.get(loop)
+        if pulse is None or not pulse.connected:
+            if pulse is not None:
+                with contextlib.suppress(Exception):
+                    pulse.disconnect()
+            pulse = pulsectl_asyncio.PulseAsync(_CLIENT_NAME)
+            await pulse.connect()
+            _pulse_conns[loop] = pulse
+        try:
+            yield pulse
+        except BaseException:
+            with contextlib.suppress(Exception):
+                pulse.disconnect()
+            _pulse_conns.pop(loop, None)
+            raise
+
+
 # ---------------------------------------------------------------------------
 # Internal async helpers
 # ---------------------------------------------------------------------------
 
 
 async def _aget_sink(pulse, sink_name: str) -> Any | None:
-    """Return the pulsectl SinkInfo for *sink_name*, or None if not found."""
+    """Return the pulsectl SinkInfo for *sink_name*, or None if not found.
+
+    Uses the server-side by-name lookup (one targeted request) instead of
+    transferring the whole sink list and scanning it here.  Deliberately
+    not an index cache: PA/PipeWire renumber sinks on BT reconnect, so
+    names are the only stable handle (see ``pa_volume_controller``).
+    """
     try:
-        sinks = await pulse.sink_list()
-        return next((s for s in sinks if s.name == sink_name), None)
+        return await pulse.get_sink_by_name(sink_name)
     except Exception as exc:
-        logger.debug("pulse: sink_list error: %s", exc)
+        # PulseIndexError (sink gone) and transport errors both collapse
+        # to None — callers treat "not found" and "unreachable" the same.
+        logger.debug("pulse: sink lookup %s failed: %s", sink_name, exc)
         return None
 
 
@@ -115,7 +178,7 @@ async def alist_sinks() -> list[dict]:
         return _fallback_list_sinks()
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sinks = await pulse.sink_list()
                 return [
                     {
@@ -131,13 +194,55 @@ async def alist_sinks() -> list[dict]:
         return _fallback_list_sinks()
 
 
+async def await_sink_appearance(candidate_names: list[str], timeout: float = 10.0) -> str | None:
+    """Wait for any sink in *candidate_names* to appear; return its name or None.
+
+    Checks the current sink list first (the sink may already exist), then
+    blocks on the server's ``sink`` event stream and re-checks on each event —
+    no polling and no fixed sleeps while the server is quiet, and the caller
+    wakes the moment PipeWire/PulseAudio publishes a matching sink.  Earlier
+    names in *candidate_names* win when several candidates already exist.
+
+    Returns ``None`` on timeout.  When pulsectl_asyncio is unavailable this
+    degrades to polling ``pactl list short sinks`` at 0.5 s intervals.
+    """
+    if not _PULSECTL_AVAILABLE:
+        return await _run_blocking(_fallback_wait_sink, candidate_names, timeout)
+    try:
+        async with asyncio.timeout(max(0.0, timeout)):
+            # Dedicated connection: this helper can park in subscribe_events()
+            # for up to *timeout* seconds, which would starve every other
+            # caller of the shared per-loop connection.
+            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+                sinks = await pulse.sink_list()
+                names = {s.name for s in sinks}
+                found = next((n for n in candidate_names if n in names), None)
+                if found:
+                    return found
+                async for _event in pulse.subscribe_events("sink"):
+                    # Re-list rather than trusting the event payload: sink
+                    # events carry only an index, and a remove+new pair can
+                    # land between iterations.
+                    sinks = await pulse.sink_list()
+                    names = {s.name for s in sinks}
+                    found = next((n for n in candidate_names if n in names), None)
+                    if found:
+                        return found
+                return None
+    except TimeoutError:
+        return None
+    except Exception as exc:
+        logger.debug("await_sink_appearance error: %s — falling back", exc)
+        return await _run_blocking(_fallback_wait_sink, candidate_names, timeout)
+
+
 async def aget_sink_description(sink_name: str) -> str | None:
     """Return the friendly description of *sink_name*, or None."""
     if not _PULSECTL_AVAILABLE:
         return _fallback_get_description(sink_name)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 return sink.description if sink else None
     except Exception as exc:
@@ -151,7 +256,7 @@ async def aset_sink_volume(sink_name: str, volume_pct: int) -> bool:
         return _fallback_set_volume(sink_name, volume_pct)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 if sink is None:
                     logger.warning("aset_sink_volume: sink %s not found", sink_name)
@@ -174,7 +279,7 @@ async def aget_sink_volume(sink_name: str) -> int | None:
         return _fallback_get_volume(sink_name)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 if sink is None:
                     return None
@@ -190,7 +295,7 @@ async def aset_sink_mute(sink_name: str, muted: bool | None) -> bool:
         return _fallback_set_mute(sink_name, muted)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 if sink is None:
                     logger.warning("aset_sink_mute: sink %s not found", sink_name)
@@ -209,7 +314,7 @@ async def aget_sink_mute(sink_name: str) -> bool | None:
         return _fallback_get_mute(sink_name)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 return bool(sink.mute) if sink else None
     except Exception as exc:
@@ -228,7 +333,7 @@ async def asuspend_sink(sink_name: str, suspend: bool) -> bool:
         return _fallback_suspend_sink(sink_name, suspend)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 sink = await _aget_sink(pulse, sink_name)
                 if sink is None:
                     logger.warning("asuspend_sink: sink %s not found", sink_name)
@@ -247,7 +352,7 @@ async def alist_sink_input_ids() -> set[int]:
         return _fallback_sink_input_ids()
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 inputs = await pulse.sink_input_list()
                 return {i.index for i in inputs}
     except Exception as exc:
@@ -261,7 +366,7 @@ async def amove_sink_input(sink_input_idx: int, sink_name: str) -> bool:
         return _fallback_move_sink_input(sink_input_idx, sink_name)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 inputs = await pulse.sink_input_list()
                 si = next((i for i in inputs if i.index == sink_input_idx), None)
                 if si is None:
@@ -301,7 +406,7 @@ async def amove_pid_sink_inputs(pid: int, sink_name: str) -> int:
         return _fallback_move_pid_sink_inputs(pid, sink_name)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 inputs = await pulse.sink_input_list()
                 sinks = await pulse.sink_list()
                 target = next((s for s in sinks if s.name == sink_name), None)
@@ -342,7 +447,7 @@ async def alist_cards() -> list[dict]:
         return _fallback_list_cards()
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 cards = await pulse.card_list()
                 result: list[dict] = []
                 for c in cards:
@@ -375,7 +480,7 @@ async def aset_card_profile(card_name: str, profile: str) -> bool:
         return await _run_blocking(_fallback_set_card_profile, card_name, profile)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 cards = await pulse.card_list()
                 card = next((c for c in cards if c.name == card_name), None)
                 if card is None:
@@ -399,7 +504,7 @@ async def acycle_card_profile(card_name: str, target: str, off_wait: float = 1.0
         return await _run_blocking(_fallback_cycle_card_profile, card_name, target, off_wait)
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 cards = await pulse.card_list()
                 card = next((c for c in cards if c.name == card_name), None)
                 if card is None:
@@ -463,7 +568,7 @@ async def areload_bluez5_discover_module() -> bool:
     try:
         try:
             list_proc = await asyncio.create_subprocess_exec(
-                "pactl",
+                _PACTL,
                 "list",
                 "modules",
                 "short",
@@ -488,7 +593,7 @@ async def areload_bluez5_discover_module() -> bool:
             return False
         try:
             unload_proc = await asyncio.create_subprocess_exec(
-                "pactl",
+                _PACTL,
                 "unload-module",
                 module_idx,
                 stdout=asyncio.subprocess.PIPE,
@@ -508,7 +613,7 @@ async def areload_bluez5_discover_module() -> bool:
         await asyncio.sleep(2.0)
         try:
             load_proc = await asyncio.create_subprocess_exec(
-                "pactl",
+                _PACTL,
                 "load-module",
                 "module-bluez5-discover",
                 stdout=asyncio.subprocess.PIPE,
@@ -539,7 +644,7 @@ async def aget_server_name() -> str:
         return _fallback_server_name()
     try:
         async with asyncio.timeout(_TIMEOUT):
-            async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+            async with _pulse_conn() as pulse:
                 info = await pulse.server_info()
                 return info.server_name or "running"
     except Exception as exc:
@@ -576,7 +681,7 @@ async def aensure_null_sink() -> bool:
     if _PULSECTL_AVAILABLE:
         try:
             async with asyncio.timeout(_TIMEOUT):
-                async with pulsectl_asyncio.PulseAsync(_CLIENT_NAME) as pulse:
+                async with _pulse_conn() as pulse:
                     sinks = await pulse.sink_list()
                     if any(s.name == STANDBY_SINK_NAME for s in sinks):
                         logger.debug("Standby null sink already exists")
@@ -600,7 +705,7 @@ def remove_null_sink() -> bool:
         return True
     try:
         r = subprocess.run(
-            ["pactl", "unload-module", str(_null_sink_module_id)],
+            [_PACTL, "unload-module", str(_null_sink_module_id)],
             capture_output=True,
             text=True,
             timeout=5,
@@ -620,13 +725,13 @@ def _fallback_load_null_sink() -> bool:
     global _null_sink_module_id
     try:
         # Check if already exists
-        r = subprocess.run(["pactl", "list", "short", "sinks"], capture_output=True, text=True, timeout=5)
+        r = subprocess.run([_PACTL, "list", "short", "sinks"], capture_output=True, text=True, timeout=5)
         if r.returncode == 0 and STANDBY_SINK_NAME in r.stdout:
             logger.debug("Standby null sink already exists (pactl)")
             return True
         r = subprocess.run(
             [
-                "pactl",
+                _PACTL,
                 "load-module",
                 "module-null-sink",
                 f"sink_name={STANDBY_SINK_NAME}",
@@ -701,6 +806,10 @@ def suspend_sink(sink_name: str, suspend: bool) -> bool:
     return _run(asuspend_sink(sink_name, suspend))
 
 
+def wait_for_sink(candidate_names: list[str], timeout: float = 10.0) -> str | None:
+    return _run(await_sink_appearance(candidate_names, timeout))
+
+
 def get_server_name() -> str:
     return _run(aget_server_name())
 
@@ -729,7 +838,7 @@ def reload_bluez5_discover_module() -> bool:
 def _fallback_list_sinks() -> list[dict]:
     try:
         r = subprocess.run(
-            ["pactl", "list", "short", "sinks"],
+            [_PACTL, "list", "short", "sinks"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -751,9 +860,25 @@ def _fallback_list_sinks() -> list[dict]:
         return []
 
 
+def _fallback_wait_sink(candidate_names: list[str], timeout: float) -> str | None:
+    """Poll ``pactl list short sinks`` until a candidate appears or *timeout*."""
+    import time as _time
+
+    deadline = _time.monotonic() + max(0.0, timeout)
+    while True:
+        names = {s["name"] for s in _fallback_list_sinks()}
+        for name in candidate_names:
+            if name in names:
+                return name
+        remaining = deadline - _time.monotonic()
+        if remaining <= 0:
+            return None
+        _time.sleep(min(0.5, remaining))
+
+
 def _fallback_get_description(sink_name: str) -> str | None:
     try:
-        r = subprocess.run(["pactl", "list", "sinks"], capture_output=True, text=True, timeout=5)
+        r = subprocess.run([_PACTL, "list", "sinks"], capture_output=True, text=True, timeout=5)
         in_target = False
         for line in r.stdout.splitlines():
             s = line.strip()
@@ -772,7 +897,7 @@ def _fallback_set_volume(sink_name: str, volume_pct: int) -> bool:
     volume_pct = max(0, min(100, volume_pct))
     try:
         r = subprocess.run(
-            ["pactl", "set-sink-volume", sink_name, f"{volume_pct}%"],
+            [_PACTL, "set-sink-volume", sink_name, f"{volume_pct}%"],
             capture_output=True,
             text=True,
             timeout=3,
@@ -785,15 +910,13 @@ def _fallback_set_volume(sink_name: str, volume_pct: int) -> bool:
 def _fallback_get_volume(sink_name: str) -> int | None:
     try:
         r = subprocess.run(
-            ["pactl", "get-sink-volume", sink_name],
+            [_PACTL, "get-sink-volume", sink_name],
             capture_output=True,
             text=True,
             timeout=3,
         )
         if r.returncode == 0:
-            import re
-
-            m = re.search(r"(\d+)%", r.stdout)
+            m = _VOLUME_PCT_RE.search(r.stdout)
             return int(m.group(1)) if m else None
     except Exception as exc:
         logger.debug("get sink volume failed: %s", exc)
@@ -804,7 +927,7 @@ def _fallback_set_mute(sink_name: str, muted: bool | None) -> bool:
     arg = "toggle" if muted is None else ("1" if muted else "0")
     try:
         r = subprocess.run(
-            ["pactl", "set-sink-mute", sink_name, arg],
+            [_PACTL, "set-sink-mute", sink_name, arg],
             capture_output=True,
             text=True,
             timeout=3,
@@ -817,7 +940,7 @@ def _fallback_set_mute(sink_name: str, muted: bool | None) -> bool:
 def _fallback_get_mute(sink_name: str) -> bool | None:
     try:
         r = subprocess.run(
-            ["pactl", "get-sink-mute", sink_name],
+            [_PACTL, "get-sink-mute", sink_name],
             capture_output=True,
             text=True,
             timeout=3,
@@ -832,7 +955,7 @@ def _fallback_get_mute(sink_name: str) -> bool | None:
 def _fallback_suspend_sink(sink_name: str, suspend: bool) -> bool:
     try:
         r = subprocess.run(
-            ["pactl", "suspend-sink", sink_name, "1" if suspend else "0"],
+            [_PACTL, "suspend-sink", sink_name, "1" if suspend else "0"],
             capture_output=True,
             text=True,
             timeout=3,
@@ -849,7 +972,7 @@ def _fallback_suspend_sink(sink_name: str, suspend: bool) -> bool:
 def _fallback_list_cards() -> list[dict]:
     """Parse `pactl list cards` output into name/driver/active_profile/profiles dicts."""
     try:
-        r = subprocess.run(["pactl", "list", "cards"], capture_output=True, text=True, timeout=5)
+        r = subprocess.run([_PACTL, "list", "cards"], capture_output=True, text=True, timeout=5)
     except (subprocess.SubprocessError, OSError):
         return []
     if r.returncode != 0:
@@ -895,7 +1018,7 @@ def _fallback_set_card_profile(card_name: str, profile: str) -> bool:
     """Set *card_name* profile via `pactl set-card-profile`. Returns True on success."""
     try:
         r = subprocess.run(
-            ["pactl", "set-card-profile", card_name, profile],
+            [_PACTL, "set-card-profile", card_name, profile],
             capture_output=True,
             text=True,
             timeout=5,
@@ -922,7 +1045,7 @@ def _fallback_cycle_card_profile(card_name: str, target: str, off_wait: float =
     # still succeed, and errors here should not block the target switch.
     try:
         subprocess.run(
-            ["pactl", "set-card-profile", card_name, "off"],
+            [_PACTL, "set-card-profile", card_name, "off"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -935,7 +1058,7 @@ def _fallback_cycle_card_profile(card_name: str, target: str, off_wait: float =
 
 def _fallback_server_name() -> str:
     try:
-        r = subprocess.run(["pactl", "info"], capture_output=True, text=True, timeout=3)
+        r = subprocess.run([_PACTL, "info"], capture_output=True, text=True, timeout=3)
         if r.returncode == 0:
             for line in r.stdout.splitlines():
                 if "Server Name" in line:
@@ -948,7 +1071,7 @@ def _fallback_server_name() -> str:
 def _fallback_sink_input_ids() -> set[int]:
     try:
         r = subprocess.run(
-            ["pactl", "list", "short", "sink-inputs"],
+            [_PACTL, "list", "short", "sink-inputs"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -969,7 +1092,7 @@ def _fallback_sink_input_ids() -> set[int]:
 def _fallback_move_sink_input(sink_input_idx: int, sink_name: str) -> bool:
     try:
         r = subprocess.run(
-            ["pactl", "move-sink-input", str(sink_input_idx), sink_name],
+            [_PACTL, "move-sink-input", str(sink_input_idx), sink_name],
             capture_output=True,
             text=True,
             timeout=3,
@@ -993,7 +1116,7 @@ def _fallback_move_pid_sink_inputs(pid: int, sink_name: str) -> int:
     """pactl fallback: normalize PID-owned inputs and move them to sink_name."""
     try:
         # Get all sink-input details to find our PID
-        r = subprocess.run(["pactl", "list", "sink-inputs"], capture_output=True, text=True, timeout=5)
+        r = subprocess.run([_PACTL, "list", "sink-inputs"], capture_output=True, text=True, timeout=5)
         if r.returncode != 0:
             return 0
         moved = 0
@@ -1008,7 +1131,7 @@ def _fallback_move_pid_sink_inputs(pid: int, sink_name: str) -> int:
                 current_pid = line.split("=", 1)[-1].strip().strip('"')
             if current_id is not None and current_pid == str(pid):
                 normalized = subprocess.run(
-                    ["pactl", "set-sink-input-volume", str(current_id), "100%"],
+                    [_PACTL, "set-sink-input-volume", str(current_id), "100%"],
                     capture_output=True,
                     text=True,
                     timeout=3,
@@ -1020,7 +1143,7 @@ def _fallback_move_pid_sink_inputs(pid: int, sink_name: str) -> int:
                         normalized.stderr.strip(),
                     )
                 r2 = subprocess.run(
-                    ["pactl", "move-sink-input", str(current_id), sink_name],
+                    [_PACTL, "move-sink-input", str(current_id), sink_name],
                     capture_output=True,
                     text=True,
                     timeout=3,
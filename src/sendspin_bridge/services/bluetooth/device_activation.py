@@ -28,7 +28,7 @@ from sendspin_bridge.services.bluetooth.avrcp_source_tracker import get_tracker
 from sendspin_bridge.services.diagnostics.sendspin_compat import filter_supported_call_kwargs
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
 
 logger = logging.getLogger(__name__)
 
@@ -531,6 +531,7 @@ def activate_device(
     index: int,
     context: DeviceActivationContext,
     default_player_name: str,
+    reserved_ports: Collection[int] = (),
 ) -> ActivationResult:
     """Build a fully-wired SendspinClient + BluetoothManager from a device dict.
 
@@ -543,7 +544,14 @@ def activate_device(
 
     ``index`` is used only as the fallback component of
     ``base_listen_port + index`` when the device dict doesn't supply an
-    explicit ``listen_port``.
+    explicit ``listen_port``.  ``reserved_ports`` holds ports the fallback
+    must not land on — explicit ``listen_port`` pins on *other* devices and
+    ports already handed to live clients.  Without it an auto-assigned
+    ``base_listen_port + index`` can silently collide with a later device's
+    explicit pin and the sendspin daemon fails to bind; the fallback now
+    advances past reserved ports instead.  An explicit ``listen_port`` on
+    *this* device is always honoured verbatim (the post-activation warning
+    pass in the orchestrator still flags explicit-vs-explicit duplicates).
 
     Raises the same exceptions the underlying factories raise; callers
     decide whether to surface them as ``summary.errors`` or propagate.
@@ -554,7 +562,13 @@ def activate_device(
     if context.effective_bridge:
         player_name = f"{player_name} @ {context.effective_bridge}"
 
-    listen_port = int(device.get("listen_port") or context.base_listen_port + index)
+    explicit_listen_port = device.get("listen_port")
+    if explicit_listen_port:
+        listen_port = int(explicit_listen_port)
+    else:
+        listen_port = context.base_listen_port + index
+        while listen_port in reserved_ports:
+            listen_port += 1
     listen_host = device.get("listen_host")
     static_delay_ms = device.get("static_delay_ms")
     if static_delay_ms is not None:
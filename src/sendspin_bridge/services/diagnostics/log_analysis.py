@@ -56,12 +56,18 @@ def extract_log_level(line: str) -> str | None:
     return match.group(1).upper()
 
 
-def classify_subprocess_stderr_level(line: str) -> str:
-    """Infer severity for raw daemon stderr text that lacks an explicit log level."""
+def classify_subprocess_stderr_level(line: str, *, lower: str | None = None) -> str:
+    """Infer severity for raw daemon stderr text that lacks an explicit log level.
+
+    *lower* lets callers that already built a lowercased copy of the
+    (stripped) line pass it in, sparing a second full-line allocation on
+    the per-stderr-line path.
+    """
     text = (line or "").strip()
     if not text:
         return "warning"
-    lower = text.lower()
+    if lower is None:
+        lower = text.lower()
     if any(marker in lower for marker in _STDERR_CRITICAL_MARKERS):
         return "critical"
     if _ERROR_WORD_RE.search(text) or any(marker in lower for marker in _STDERR_ERROR_MARKERS):
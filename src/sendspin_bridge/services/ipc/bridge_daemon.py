@@ -424,10 +424,18 @@ class BridgeDaemon(SendspinDaemon):
             self._bridge_status["playing"] = is_playing
             self._bridge_status["state_changed_at"] = datetime.now(tz=UTC).isoformat()
             self._notify()
+        # Guard on the current value: repeated start events (one per
+        # re-anchor) would otherwise re-write an unchanged flag and pay a
+        # full-status json.dumps in _emit_status just to hit its dedup.
         if event == "stop":
-            self._bridge_status["audio_streaming"] = False
-            self._notify()
-        elif event == "start" and self._bridge_status.get("audio_format"):
+            if self._bridge_status.get("audio_streaming"):
+                self._bridge_status["audio_streaming"] = False
+                self._notify()
+        elif (
+            event == "start"
+            and self._bridge_status.get("audio_format")
+            and not self._bridge_status.get("audio_streaming")
+        ):
             # Re-anchor or track change: format_change won't fire again
             # if codec/rate/depth/channels are unchanged, but audio IS flowing.
             self._bridge_status["audio_streaming"] = True
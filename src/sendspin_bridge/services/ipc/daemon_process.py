@@ -230,10 +230,12 @@ class _JsonLineHandler(logging.Handler):
             if self._status is not None and _REANCHOR_MSG in msg:
                 with _status_lock:
                     # Extract sync error value if present: "Sync error 123.4 ms too large; re-anchoring"
+                    # partition() locates the prefix in one scan instead of
+                    # an `in` test followed by a split over the same text.
                     sync_error_ms = None
-                    if _SYNC_ERROR_PREFIX in msg:
+                    _, sep, after = msg.partition(_SYNC_ERROR_PREFIX)
+                    if sep:
                         try:
-                            after = msg.split(_SYNC_ERROR_PREFIX, 1)[1]
                             sync_error_ms = float(after.split()[0])
                         except (IndexError, ValueError):
                             pass  # best-effort parse inside log handler
@@ -92,6 +92,16 @@ class SubprocessIpcService:
         # deny every key (drop all status updates).
         self._allowed_keys = allowed_keys
         self._log_gate = _LogRateGate(log_rate_per_s, log_burst, log_clock)
+        # Single dispatch on the ``type`` discriminator.  Probing every
+        # envelope parser in sequence made each one re-coerce (copy) the
+        # message dict before rejecting it, so the log firehose — by far
+        # the most common message kind — paid for two failed status/error
+        # parse attempts per line.
+        self._handlers: dict[str, Callable[[dict[str, Any]], dict[str, Any] | None]] = {
+            "status": self._handle_status,
+            "error": self._handle_error,
+            "log": self._handle_log,
+        }
 
     async def read_stream(self, stdout) -> None:
         """Parse daemon stdout JSON-line messages until EOF."""
@@ -115,46 +125,66 @@ class SubprocessIpcService:
 
     def parse_line(self, line: bytes) -> dict[str, Any] | None:
         """Decode one stdout line into a JSON message if possible."""
+        # json.loads accepts UTF-8 bytes and tolerates surrounding
+        # whitespace, so the per-line decode().strip() copy is redundant;
+        # a bad-UTF-8 line raises UnicodeDecodeError, a ValueError.
         try:
-            return coerce_message_dict(json.loads(line.decode().strip()))
+            return coerce_message_dict(json.loads(line))
         except (json.JSONDecodeError, ValueError):
             return None
 
     def handle_message(self, msg: dict[str, Any]) -> dict[str, Any] | None:
         """Dispatch one parsed IPC message and return status updates if present."""
         self._warn_incompatible_protocol(msg.get(IPC_PROTOCOL_VERSION_KEY))
+        # Guard the discriminator: a daemon line can be a valid JSON object
+        # whose ``type`` is a list/dict, and an unhashable key would raise
+        # out of the reader task (which has no restart supervision).  This
+        # path is garbage-tolerant by design — unknown shapes are dropped,
+        # never fatal.
+        msg_type = msg.get("type")
+        handler = self._handlers.get(msg_type) if isinstance(msg_type, str) else None
+        if handler is None:
+            return None
+        return handler(msg)
+
+    def _handle_status(self, msg: dict[str, Any]) -> dict[str, Any] | None:
         status_envelope = parse_status_envelope(msg, allowed_keys=self._allowed_keys)
-        if status_envelope is not None:
-            if status_envelope.updates:
-                self._status_updater(status_envelope.updates)
-            return status_envelope.updates
+        if status_envelope is None:
+            return None
+        if status_envelope.updates:
+            self._status_updater(status_envelope.updates)
+        return status_envelope.updates
 
+    def _handle_error(self, msg: dict[str, Any]) -> dict[str, Any] | None:
         error_envelope = parse_error_envelope(msg)
-        if error_envelope is not None:
-            updates = {
-                "last_error": error_envelope.message,
-                "last_error_at": error_envelope.details.get("at"),
-            }
-            self._status_updater(updates)
-            self._logger.error("[%s/proc] %s", self.player_name, error_envelope.message)
-            return updates
+        if error_envelope is None:
+            return None
+        updates = {
+            "last_error": error_envelope.message,
+            "last_error_at": error_envelope.details.get("at"),
+        }
+        self._status_updater(updates)
+        self._logger.error("[%s/proc] %s", self.player_name, error_envelope.message)
+        return updates
 
+    def _handle_log(self, msg: dict[str, Any]) -> None:
         log_envelope = parse_log_envelope(msg)
-        if log_envelope is not None:
-            # Status/error envelopes above are never dropped — only the
-            # log firehose is gated (issue #345).
-            if not self._log_gate.allow():
-                return None
-            suppressed = self._log_gate.take_suppressed_report()
-            if suppressed:
-                self._logger.warning(
-                    "[%s] Suppressed %d daemon log line(s) — subprocess exceeded %.0f lines/s",
-                    self.player_name,
-                    suppressed,
-                    _LOG_RATE_PER_S,
-                )
-            log_fn = self._log_methods.get(log_envelope.level, self._logger.info)
-            log_fn("[%s/proc] %s", self.player_name, log_envelope.msg)
+        if log_envelope is None:
+            return None
+        # Status/error envelopes are never dropped — only the log
+        # firehose is gated (issue #345).
+        if not self._log_gate.allow():
+            return None
+        suppressed = self._log_gate.take_suppressed_report()
+        if suppressed:
+            self._logger.warning(
+                "[%s] Suppressed %d daemon log line(s) — subprocess exceeded %.0f lines/s",
+                self.player_name,
+                suppressed,
+                _LOG_RATE_PER_S,
+            )
+        log_fn = self._log_methods.get(log_envelope.level, self._logger.info)
+        log_fn("[%s/proc] %s", self.player_name, log_envelope.msg)
         return None
 
     def _warn_incompatible_protocol(self, value: object) -> None:
@@ -110,7 +110,7 @@ class SubprocessStderrService:
         else:
             self._consecutive_connection_errors = 0
 
-        level = classify_subprocess_stderr_level(text)
+        level = classify_subprocess_stderr_level(text, lower=lower)
         if level in ("error", "critical"):
             self._update_status(
                 {
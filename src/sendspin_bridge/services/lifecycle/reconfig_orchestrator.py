@@ -463,11 +463,18 @@ class ReconfigOrchestrator:
             # restart would produce, keeping MA/UI identity stable across
             # restarts when ``player_name`` is absent from the config entry.
             resolved_default_name = str(device_payload.get("player_name") or context.default_player_name)
+            # Ports held by live clients are off-limits to the
+            # ``base_listen_port + index`` fallback — mirrors the startup
+            # path's two-pass reservation so a live-added device without an
+            # explicit ``listen_port`` can't silently collide with a
+            # running client's port.
+            live_ports = {int(getattr(existing, "listen_port", 0) or 0) for existing in existing_clients} - {0}
             result = activate_device(
                 device_payload,
                 index=device_index,
                 context=context,
                 default_player_name=resolved_default_name,
+                reserved_ports=live_ports,
             )
         except Exception as exc:
             logger.exception("START_CLIENT activation failed for %s", action.label or action.mac)
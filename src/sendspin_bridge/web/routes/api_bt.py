@@ -68,6 +68,12 @@ _INFO_RSSI_PAT = re.compile(
 )
 _SHOW_CTRL_PAT = re.compile(r"^Controller\s+([0-9A-Fa-f:]{17})")
 _SHOW_DEV_PAT = re.compile(r"^Device\s+([0-9A-Fa-f:]{17})")
+# Leading interactive-prompt echo such as ``[ENEBY20]> `` (anchored so
+# bracket-prefixed async notifications like ``[CHG] `` survive intact).
+_PROMPT_ECHO_PAT = re.compile(r"^\[[^\]]+\]>\s*")
+# Device names that are really a MAC echoed back (``AA:BB…`` / ``AA-BB…``).
+_MAC_AS_NAME_PAT = re.compile(r"^[0-9A-Fa-f]{2}[-:]")
+_INFO_NAME_PAT = re.compile(r"\bName:\s+(.*)")
 _scan_lock = threading.Lock()
 
 
@@ -556,7 +562,7 @@ def _parse_paired_stdout(stdout: str) -> "list[tuple[str, str]]":
         # bracket-prefixed async notifications (``[CHG] ``/``[NEW] ``/
         # ``[DEL] ``) survive and fail the ``startswith("Device ")`` check
         # below.
-        stripped = re.sub(r"^\[[^\]]+\]>\s*", "", clean).lstrip()
+        stripped = _PROMPT_ECHO_PAT.sub("", clean).lstrip()
         if not stripped.startswith("Device "):
             continue
         m = _DEV_PAT.match(stripped)
@@ -564,7 +570,7 @@ def _parse_paired_stdout(stdout: str) -> "list[tuple[str, str]]":
             continue
         mac = m.group(1).upper()
         name = m.group(2).strip()
-        if re.match(r"^[0-9A-Fa-f]{2}[-:]", name):
+        if _MAC_AS_NAME_PAT.match(name):
             name = ""
         results.append((mac, name))
     return results
@@ -1349,7 +1355,7 @@ def _parse_scan_output(
             mac = scan_m.group(1).upper()
             name = scan_m.group(2).strip()
             seen.add(mac)
-            if name and not re.match(r"^[0-9A-Fa-f]{2}[-:]", name):
+            if name and not _MAC_AS_NAME_PAT.match(name):
                 names[mac] = name
             continue
         chg_n = _CHG_NAME_PAT.search(clean)
@@ -1389,7 +1395,7 @@ def _resolve_unnamed_devices(all_macs: "set[str]", names: "dict[str, str]") -> N
         if db_m:
             mac = db_m.group(1).upper()
             name = db_m.group(2).strip()
-            if mac in unnamed and name and not re.match(r"^[0-9A-Fa-f]{2}[-:]", name):
+            if mac in unnamed and name and not _MAC_AS_NAME_PAT.match(name):
                 names[mac] = name
 
 
@@ -1413,10 +1419,10 @@ def _enrich_scan_device(mac: str, names: "dict[str, str]", audio_only: bool = Tr
     except Exception:
         return {"mac": mac, "name": names.get(mac, mac), "audio_capable": True}, None
     if mac not in names:
-        nm = re.search(r"\bName:\s+(.*)", out)
+        nm = _INFO_NAME_PAT.search(out)
         if nm:
             n = nm.group(1).strip()
-            if n and not re.match(r"^[0-9A-Fa-f]{2}[-:]", n):
+            if n and not _MAC_AS_NAME_PAT.match(n):
                 names[mac] = n
     audio_capable, reason = _classify_audio_capability(out)
     if audio_only and not audio_capable: